@@ -1,31 +1,47 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import requests
+import httpx
+import asyncio
+import orjson
+from cachetools import TTLCache
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 import datetime
 import time
-import warnings
 import configparser
 import sys
-import json
 import logging
-from logging.handlers import RotatingFileHandler
-from urllib3.exceptions import NotOpenSSLWarning
+import os
+import queue
+import re
+import socket
+import atexit
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
-# 屏蔽 NotOpenSSLWarning 警告
-warnings.simplefilter("ignore", NotOpenSSLWarning)
+try:
+    import ahocorasick
+except ImportError:  # 未安装 pyahocorasick 时退回到正则匹配
+    ahocorasick = None
+
+# 北京时间 (UTC+8)，全局共用一个时区对象
+CST8 = datetime.timezone(datetime.timedelta(hours=8))
 
 def setup_logging():
     """配置日志系统，支持控制台和文件轮转"""
     logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
+    # 日志级别可通过环境变量调整，无效值退回到 INFO，避免程序在启动时直接崩溃
+    level_name = os.environ.get("WEATHER_LOG_LEVEL", "INFO")
+    level = logging.getLevelName(level_name.upper())
+    invalid_level = not isinstance(level, int)
+    logger.setLevel(logging.INFO if invalid_level else level)
     
     # 创建一个格式化器
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     
-    # 配置控制台处理器
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # 配置控制台处理器，仅在交互终端或显式设置环境变量时输出，后台运行时只写日志文件
+    if sys.stdout.isatty() or os.environ.get("WEATHER_MONITOR_CONSOLE"):
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
     
     # 配置文件处理器，实现日志轮转
     # 当文件达到1MB时轮转，最多保留5个备份文件
@@ -33,7 +49,65 @@ def setup_logging():
         'weather_monitor.log', maxBytes=1*1024*1024, backupCount=5, encoding='utf-8'
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    # 文件写入交给后台线程处理，主循环只需将日志记录放入队列，不会被磁盘IO阻塞
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop) # 程序退出时写完队列中剩余的日志
+
+    if invalid_level:
+        logger.warning("环境变量 WEATHER_LOG_LEVEL=%s 无效，已使用默认级别 INFO。", level_name)
+
+def build_keyword_matcher(keywords):
+    """将关键词列表预编译为匹配函数，一次扫描即可判断文本是否包含任一关键词"""
+    if ahocorasick is None:
+        pattern = re.compile("|".join(map(re.escape, keywords)))
+        return lambda text: pattern.search(text) is not None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+class FeishuPushError(Exception):
+    """飞书接口返回了非成功的业务状态码。"""
+
+def _is_retryable(e):
+    """判断异常是否值得重试：除限流(429)外，4xx 客户端错误和无效URL重试也不会成功。"""
+    if isinstance(e, httpx.HTTPStatusError):
+        status = e.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(e, (httpx.HTTPError, orjson.JSONDecodeError, FeishuPushError))
+
+_backoff = wait_exponential_jitter(initial=1, max=30)
+
+def _wait_backoff(retry_state):
+    """指数退避加随机抖动，最长等待30秒；服务端指定了 Retry-After 时以其为准（最长60秒）。"""
+    e = retry_state.outcome.exception()
+    if isinstance(e, httpx.HTTPStatusError):
+        try:
+            return min(60.0, max(0.0, float(e.response.headers["Retry-After"])))
+        except (KeyError, ValueError):
+            pass
+    return _backoff(retry_state)
+
+def _log_retry(retry_state):
+    """仅在失败重试前记录日志，成功路径不产生额外日志。"""
+    logging.getLogger(__name__).warning(
+        "请求失败，第 %d 次尝试: %s", retry_state.attempt_number, retry_state.outcome.exception()
+    )
+
+# 网络请求的统一重试策略，最多尝试5次
+_retry_policy = retry(
+    stop=stop_after_attempt(5),
+    wait=_wait_backoff,
+    retry=retry_if_exception(_is_retryable),
+    before_sleep=_log_retry,
+    reraise=True,
+)
 
 class WeatherMonitor:
     """
@@ -43,6 +117,22 @@ class WeatherMonitor:
         "晴": "☀️", "多云": "⛅", "阴": "☁️", "小雨": "🌧", "中雨": "🌧",
         "大雨": "🌧", "阵雨": "🌦", "雷阵雨": "⛈", "雪": "❄️", "雾": "🌫", "霾": "🌫",
     }
+    # 根据您的最终方案定义关键词
+    RAIN_KEYWORDS = ("阵雨", "中雨", "大雨", "暴雨", "极端降雨")
+    SEVERE_KEYWORDS = ("冰雹", "台风", "雪", "暴雪", "大雪", "沙尘暴", "雾", "霾", "冻雨", "雨夹雪")
+    SEVERE_RAIN_KEYWORDS = ("中雨", "大雨", "暴雨", "极端降雨")
+    # 降雨日期标题后缀，键为3位掩码：第 i 位表示第 i 天（今天/明天/后天）有雨
+    _RAIN_SUFFIX = {
+        0b001: "-今天有雨", 0b010: "-明天有雨", 0b100: "-后天有雨",
+        0b011: "-今明天有雨", 0b110: "-明后天有雨", 0b101: "-今后天有雨",
+        0b111: "-未来三天有雨",
+    }
+    # 预先序列化的飞书卡片消息骨架，仅需填入颜色主题、标题和正文
+    _CARD_TEMPLATE = (
+        b'{"msg_type":"interactive","card":{"config":{"wide_screen_mode":true},'
+        b'"header":{"template":"%s","title":{"content":%s,"tag":"plain_text"}},'
+        b'"elements":[{"tag":"div","text":{"content":%s,"tag":"lark_md"}}]}}'
+    )
 
     def __init__(self, config_path='config.ini'):
         """使用配置文件初始化监控器。"""
@@ -53,7 +143,32 @@ class WeatherMonitor:
         
         self.rain_active = False
         self.last_daily_push_date = None
-        self.session = requests.Session()
+        # 强降雨持续期间无需每次都重新获取，只需定期确认降雨是否结束
+        self._last_hourly_fetch_ts = 0.0
+        self._hourly_refresh_while_active_s = 30 * 60
+        # 开启 HTTP/2 多路复用和响应压缩，日报与逐小时请求可共用同一连接
+        # 关闭 Nagle 算法并开启 TCP 保活，减少飞书小包推送的延迟
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=0,  # 传输层不重试，所有重试统一交给 _retry_policy，避免两层重试叠加
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            socket_options=[
+                (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ],
+        )
+        self.client = httpx.AsyncClient(
+            transport=transport,
+            headers={"Accept-Encoding": "gzip, br"},
+            timeout=10,
+        )
+        # 天气预报缓存，按地点缓存成功的API结果，避免同一时段内重复请求
+        self._daily_cache = TTLCache(maxsize=4, ttl=self.daily_cache_ttl_minutes * 60)
+        self._hourly_cache = TTLCache(maxsize=4, ttl=self.hourly_cache_ttl_minutes * 60)
+        # 预编译关键词匹配器，避免每次检查时逐个关键词扫描文本
+        self._match_rain = build_keyword_matcher(self.RAIN_KEYWORDS)
+        self._match_severe = build_keyword_matcher(self.SEVERE_KEYWORDS)
+        self._match_severe_rain = build_keyword_matcher(self.SEVERE_RAIN_KEYWORDS)
 
     def _load_config(self):
         """从解析过的文件中加载配置。"""
@@ -72,23 +187,38 @@ class WeatherMonitor:
         self.check_interval_minutes = self.config.getint('Settings', 'check_interval_minutes')
         self.rain_threshold_precip = self.config.getfloat('Settings', 'rain_threshold_precip')
         self.rain_threshold_pop = self.config.getint('Settings', 'rain_threshold_pop')
+        self.daily_cache_ttl_minutes = self.config.getint('Settings', 'daily_cache_ttl_minutes', fallback=60)
+        self.hourly_cache_ttl_minutes = self.config.getint('Settings', 'hourly_cache_ttl_minutes', fallback=15)
+
+    @_retry_policy
+    async def _get_json(self, url):
+        """发送 GET 请求并解析 JSON，失败时由重试策略处理。"""
+        resp = await self.client.get(url)
+        resp.raise_for_status()  # 对错误的HTTP状态码抛出异常
+        return orjson.loads(resp.content)
 
-    def _request_with_retry(self, url, max_retry=5, delay=3):
+    async def _request_with_retry(self, url):
         """带重试逻辑的网络请求。"""
-        for attempt in range(max_retry):
-            try:
-                resp = self.session.get(url, timeout=10)
-                resp.raise_for_status()  # 对错误的HTTP状态码抛出异常
-                return resp.json()
-            except requests.exceptions.RequestException as e:
-                self.logger.warning(f"请求失败，第 {attempt + 1} 次尝试: {e}")
-                time.sleep(delay)
-        self.logger.error("超过最大重试次数，跳过本次请求。")
-        return None
-
-    def push_to_feishu(self, title, content, max_retry=5, delay=3):
+        try:
+            return await self._get_json(url)
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError) as e:
+            self.logger.error(f"请求失败，跳过本次请求: {e}")
+            return None
+
+    @_retry_policy
+    async def _post_feishu(self, body):
+        """发送飞书卡片消息，返回码异常时抛出 FeishuPushError 以触发重试。"""
+        resp = await self.client.post(
+            self.feishu_webhook_url, content=body, headers={"Content-Type": "application/json"}
+        )
+        resp.raise_for_status()
+        resp_json = orjson.loads(resp.content)
+        if resp_json.get("StatusCode") != 0 and resp_json.get("code") != 0:
+            raise FeishuPushError(f"飞书消息推送返回异常: {resp_json}")
+
+    async def push_to_feishu(self, title, content):
         """带重试逻辑推送飞书通知。"""
-        self.logger.info(f"正在推送飞书消息：{title}")
+        self.logger.info("正在推送飞书消息：%s", title)
         
         # 飞书卡片消息颜色主题映射
         card_template = "blue"
@@ -97,64 +227,57 @@ class WeatherMonitor:
         elif "📢" in title:
             card_template = "green"
 
-        data = {
-            "msg_type": "interactive",
-            "card": {
-                "config": {"wide_screen_mode": True},
-                "header": {
-                    "template": card_template,
-                    "title": {"content": title, "tag": "plain_text"}
-                },
-                "elements": [{"tag": "div", "text": {"content": content, "tag": "lark_md"}}]
-            }
-        }
+        body = self._CARD_TEMPLATE % (card_template.encode(), orjson.dumps(title), orjson.dumps(content))
         
-        for attempt in range(max_retry):
-            try:
-                resp = self.session.post(self.feishu_webhook_url, json=data, timeout=10)
-                resp.raise_for_status()
-                resp_json = resp.json()
-                if resp_json.get("StatusCode") == 0 or resp_json.get("code") == 0:
-                    self.logger.info("飞书消息推送成功。")
-                    return True
-                else:
-                    self.logger.warning(f"飞书消息推送返回异常: {resp_json}")
-            except requests.exceptions.RequestException as e:
-                self.logger.warning(f"推送失败，第 {attempt + 1} 次尝试: {e}")
-            
-            time.sleep(delay)
+        try:
+            await self._post_feishu(body)
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError, FeishuPushError) as e:
+            self.logger.error(f"推送失败，跳过本次推送: {e}")
+            return False
 
-        self.logger.error("超过最大重试次数，跳过本次推送。")
-        return False
+        self.logger.info("飞书消息推送成功。")
+        return True
 
-    def get_daily_weather(self):
+    async def get_daily_weather(self):
         """获取未来3天天气预报的原始数据列表。"""
+        if self.location in self._daily_cache:
+            self.logger.info("使用缓存的未来3天天气数据。")
+            return self._daily_cache[self.location]
+
         self.logger.info("正在获取未来3天天气...")
         url = f"{self.api_host}/v7/weather/3d?location={self.location}&key={self.qweather_key}"
-        resp = self._request_with_retry(url)
+        resp = await self._request_with_retry(url)
         if not resp or resp.get('code') != '200':
             self.logger.error(f"获取3天天气失败。API响应: {resp}")
             return None
         
         self.logger.info("未来3天天气获取完成。")
-        return resp.get("daily", [])
+        daily = resp.get("daily", [])
+        self._daily_cache[self.location] = daily
+        return daily
 
-    def get_hourly_weather(self):
+    async def get_hourly_weather(self):
         """获取未来6小时天气，并返回结构化数据列表。"""
-        self.logger.info("正在获取未来6小时天气...")
-        url = f"{self.api_host}/v7/weather/24h?location={self.location}&key={self.qweather_key}"
-        resp = self._request_with_retry(url)
-        if not resp or resp.get('code') != '200':
-            self.logger.error(f"获取未来6小时天气失败。API响应: {resp}")
-            return []
-
-        now = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=8)))
+        if self.location in self._hourly_cache:
+            self.logger.info("使用缓存的逐小时天气数据。")
+            hourly_items = self._hourly_cache[self.location]
+        else:
+            self.logger.info("正在获取未来6小时天气...")
+            url = f"{self.api_host}/v7/weather/24h?location={self.location}&key={self.qweather_key}"
+            resp = await self._request_with_retry(url)
+            if not resp or resp.get('code') != '200':
+                self.logger.error(f"获取未来6小时天气失败。API响应: {resp}")
+                return []
+            hourly_items = resp.get("hourly", [])
+            self._hourly_cache[self.location] = hourly_items
+
+        now = datetime.datetime.now(CST8)
         next_6_hours = now + datetime.timedelta(hours=6)
         
         hourly_forecasts = []
 
-        for item in resp.get("hourly", []):
-            fx_time = datetime.datetime.fromisoformat(item["fxTime"].replace("Z", "+00:00")).astimezone(datetime.timezone(datetime.timedelta(hours=8)))
+        for item in hourly_items:
+            fx_time = datetime.datetime.fromisoformat(item["fxTime"]).astimezone(CST8)
             if now <= fx_time <= next_6_hours:
                 hourly_forecasts.append({
                     "time": fx_time.strftime('%H:%M'),
@@ -162,17 +285,17 @@ class WeatherMonitor:
                     "pop": int(item.get("pop", "0")),
                 })
         
-        self.logger.info(f"未来6小时天气获取完成，共 {len(hourly_forecasts)} 条数据。")
+        self.logger.info("未来6小时天气获取完成，共 %d 条数据。", len(hourly_forecasts))
         return hourly_forecasts
 
-    def _handle_daily_push(self, now):
+    async def _handle_daily_push(self, now):
         """处理每日定时推送逻辑，并生成动态标题和检查未来预警。"""
         if now.hour == self.daily_push_hour and now.minute == self.daily_push_minute:
             today_str = now.strftime("%Y-%m-%d")
             if self.last_daily_push_date != today_str:
-                self.logger.info(f"到达每日推送时间 {self.daily_push_hour:02}:{self.daily_push_minute:02}，准备推送...")
+                self.logger.info("到达每日推送时间 %02d:%02d，准备推送...", self.daily_push_hour, self.daily_push_minute)
                 
-                forecast_data = self.get_daily_weather()
+                forecast_data = await self.get_daily_weather()
                 if not forecast_data:
                     self.logger.error("获取3天天气失败，跳过本次推送。")
                     return
@@ -192,57 +315,43 @@ class WeatherMonitor:
 
                 # --- 检查未来3天天气事件 ---
                 rain_alerts, other_severe_alerts = [], []
-                rain_days_indices, severe_days_indices = [], []
-                
-                # 根据您的最终方案定义关键词
-                rain_keywords = ["阵雨", "中雨", "大雨", "暴雨", "极端降雨"]
-                other_severe_keywords = ["冰雹", "台风", "雪", "暴雪", "大雪", "沙尘暴", "雾", "霾", "冻雨", "雨夹雪"]
+                rain_mask, severe_mask = 0, 0
+                today = now.date()
+                day_map = {0: "今天", 1: "明天", 2: "后天"}
 
                 for daily_forecast in forecast_data:
                     precip_mm = float(daily_forecast.get('precip', '0.0'))
                     text_day = daily_forecast.get('textDay', '')
                     text_night = daily_forecast.get('textNight', '')
-                    text_to_check = text_day + text_night
                     
-                    date_obj = datetime.datetime.strptime(daily_forecast.get('fxDate'), '%Y-%m-%d').date()
-                    days_diff = (date_obj - now.date()).days
-                    day_map = {0: "今天", 1: "明天", 2: "后天"}
+                    date_obj = datetime.date.fromisoformat(daily_forecast['fxDate'])
+                    days_diff = (date_obj - today).days
                     date_prefix = day_map.get(days_diff, daily_forecast.get('fxDate'))
 
                     # --- 检查降雨事件（最终融合方案）---
                     # 1. 检查关键字定义的降雨
-                    is_rain_by_keyword = any(k in text_to_check for k in rain_keywords)
+                    is_rain_by_keyword = self._match_rain(text_day) or self._match_rain(text_night)
 
                     # 2. 检查降水量达标且含“雨”字的降雨
-                    is_rain_by_precip = (precip_mm >= 5.0 and '雨' in text_to_check)
+                    is_rain_by_precip = (precip_mm >= 5.0 and ('雨' in text_day or '雨' in text_night))
 
                     # 满足任一条件即为需要提醒的降雨
                     if is_rain_by_keyword or is_rain_by_precip:
                         rain_alerts.append(f"∙ **{date_prefix}**: {text_day}，预计降水 {precip_mm}mm")
-                        if days_diff in day_map: rain_days_indices.append(days_diff)
+                        if 0 <= days_diff <= 2: rain_mask |= 1 << days_diff
 
                     # --- 检查其他恶劣天气 ---
-                    for keyword in other_severe_keywords:
-                        if keyword in text_to_check:
-                            other_severe_alerts.append(f"∙ **{date_prefix}**: {text_day}")
-                            if days_diff in day_map: severe_days_indices.append(days_diff)
-                            break # 避免重复添加
+                    # 只取第一个命中的关键词，避免重复添加
+                    if self._match_severe(text_day) or self._match_severe(text_night):
+                        other_severe_alerts.append(f"∙ **{date_prefix}**: {text_day}")
+                        if 0 <= days_diff <= 2: severe_mask |= 1 << days_diff
 
                 # --- 构建动态标题 ---
                 title = ""
-                if severe_days_indices:
+                if severe_mask:
                     title = "⚠️ 今日天气-恶劣天气预警"
-                elif rain_days_indices:
-                    rain_days_set = set(rain_days_indices)
-                    suffix = ""
-                    if len(rain_days_set) == 3: suffix = "-未来三天有雨"
-                    elif rain_days_set == {0, 1}: suffix = "-今明天有雨"
-                    elif rain_days_set == {1, 2}: suffix = "-明后天有雨"
-                    elif rain_days_set == {0, 2}: suffix = "-今后天有雨"
-                    elif rain_days_set == {0}: suffix = "-今天有雨"
-                    elif rain_days_set == {1}: suffix = "-明天有雨"
-                    elif rain_days_set == {2}: suffix = "-后天有雨"
-                    title = f"⚠️ 今日天气{suffix}"
+                elif rain_mask:
+                    title = f"⚠️ 今日天气{self._RAIN_SUFFIX[rain_mask]}"
                 else:
                     title = "📢 今日天气"
 
@@ -258,42 +367,47 @@ class WeatherMonitor:
                 if rain_alerts:
                     full_content += f"\n\n---\n**降雨提醒**  \n" + "\n".join(rain_alerts)
 
-                self.push_to_feishu(title, full_content)
+                await self.push_to_feishu(title, full_content)
                 self.last_daily_push_date = today_str
 
-    def _handle_rain_alert(self, now):
+    async def _handle_rain_alert(self, now):
         """处理基于状态的降雨检查和预警逻辑（仅中雨及以上）。"""
         if now.minute % self.check_interval_minutes == 0:
-            self.logger.info("检查未来6小时天气情况...")
-            hourly_forecasts = self.get_hourly_weather()
+            # 以本轮检查开始的时间计时，不计入网络耗时；并预留一个检查间隔的余量，
+            # 保证检查间隔不短于刷新周期时不会被跳过
+            tick_ts = time.monotonic()
+            elapsed = tick_ts - self._last_hourly_fetch_ts
+            if self.rain_active and elapsed + self.check_interval_minutes * 60 <= self._hourly_refresh_while_active_s:
+                self.logger.info("强降雨持续中，距上次检查不足%d分钟，跳过本次检查。", self._hourly_refresh_while_active_s // 60)
+                return
 
-            # 如果获取到了天气数据，就打印出来
+            self.logger.info("检查未来6小时天气情况...")
+            hourly_forecasts = await self.get_hourly_weather()
             if hourly_forecasts:
-                forecast_lines = [f"∙ {f['time']} | {f['text']} | 降水概率 {f['pop']}%") for f in hourly_forecasts]
-                self.logger.info("未来6小时天气预报:\n" + "\n".join(forecast_lines))
-
-            severe_rain_keywords = ["中雨", "大雨", "暴雨", "极端降雨"]
-            detected_forecasts = []
-            rain_start_time = None
-
-            for item in hourly_forecasts:
-                if any(keyword in item["text"] for keyword in severe_rain_keywords):
-                    detected_forecasts.append(item)
-                    if rain_start_time is None:
-                        rain_start_time = item["time"]
-            
-            rain_detected = bool(detected_forecasts)
+                self._last_hourly_fetch_ts = tick_ts
+
+            # 如果获取到了天气数据，就打印出来（日志级别高于 INFO 时跳过格式化）
+            if hourly_forecasts and self.logger.isEnabledFor(logging.INFO):
+                forecast_lines = "\n".join(f"∙ {f['time']} | {f['text']} | 降水概率 {f['pop']}%" for f in hourly_forecasts)
+                self.logger.info("未来6小时天气预报:\n%s", forecast_lines)
+
+            # 只需找到第一条强降雨即可判断状态，详情留到真正推送时再整理
+            first_detected = next((item for item in hourly_forecasts if self._match_severe_rain(item["text"])), None)
+            rain_detected = first_detected is not None
 
             if rain_detected:
                 if not self.rain_active:
-                    self.logger.info(f"检测到新的强降雨事件，预计在 {rain_start_time} 开始。准备推送预警。")
+                    rain_start_time = first_detected["time"]
+                    self.logger.info("检测到新的强降雨事件，预计在 %s 开始。准备推送预警。", rain_start_time)
                     
+                    detected_forecasts = [item for item in hourly_forecasts if self._match_severe_rain(item["text"])]
                     title = f"⚠️ 预计 {rain_start_time} 有强降雨，请注意"
                     header = f"📍 {self.location_name}\n\n---\n"
-                    hourly_lines = [f"∙ {f['time']} | {f['text']} | 降水概率 {f['pop']}%") for f in detected_forecasts]
-                    hourly_content = "💧 **强降雨详情**  \n" + "  \n".join(hourly_lines)
+                    hourly_content = "💧 **强降雨详情**  \n" + "  \n".join(
+                        f"∙ {f['time']} | {f['text']} | 降水概率 {f['pop']}%" for f in detected_forecasts
+                    )
                     
-                    self.push_to_feishu(title, header + hourly_content)
+                    await self.push_to_feishu(title, header + hourly_content)
                     self.rain_active = True
                 else:
                     self.logger.info("强降雨持续中，不重复推送。")
@@ -304,7 +418,7 @@ class WeatherMonitor:
                     self.logger.info("未来6小时无强降雨风险，跳过推送。")
                 self.rain_active = False
 
-    def run_test_push(self):
+    async def run_test_push(self):
         """发送一个包含所有元素的测试推送，用于检查格式。"""
         self.logger.info("发送测试推送...")
         
@@ -322,25 +436,37 @@ class WeatherMonitor:
         content = f"{header}\n{daily_summary}\n\n---\n{rain_warning}"
         title = "📢【测试】天气及降雨提醒"
 
-        self.push_to_feishu(title, content)
+        # 在驱动本协程的事件循环内关闭连接池，避免遗留套接字
+        async with self.client:
+            await self.push_to_feishu(title, content)
         self.logger.info("测试推送发送完成。")
 
-    def run(self):
+    async def run(self):
         """天气监控的主循环。"""
         self.logger.info("脚本启动，进入主循环...")
-        while True:
-            now = datetime.datetime.now(datetime.timezone(datetime.timedelta(hours=8)))
+        # 主循环退出（包括异常崩溃）时关闭连接池，重启后会重新创建监控器和客户端
+        async with self.client:
+            while True:
+                now = datetime.datetime.now(CST8)
+                now_ts = time.monotonic()
             
-            self._handle_daily_push(now)
-            self._handle_rain_alert(now)
+                # 每日推送与降雨检查互不依赖，并发执行以重叠网络等待
+                await asyncio.gather(
+                    self._handle_daily_push(now),
+                    self._handle_rain_alert(now),
+                )
 
-            # 计算并休眠到下一个检查时间点
-            next_minute = (self.check_interval_minutes - (now.minute % self.check_interval_minutes)) % self.check_interval_minutes
-            if next_minute == 0:
-                next_minute = self.check_interval_minutes
-            sleep_seconds = next_minute * 60 - now.second
-            self.logger.info(f"等待 {sleep_seconds:.0f} 秒后进行下一次检查...")
-            time.sleep(sleep_seconds)
+                # 计算下一个检查时间点的绝对截止时间，并休眠到该时间点
+                # 醒来后由各处理函数重新校验时间，若时钟跳变导致提前醒来则本轮不做任何操作
+                next_minute = (self.check_interval_minutes - (now.minute % self.check_interval_minutes)) % self.check_interval_minutes
+                if next_minute == 0:
+                    next_minute = self.check_interval_minutes
+                target_dt = now.replace(second=0, microsecond=0) + datetime.timedelta(minutes=next_minute)
+                # 截止时间基于本轮的 now，处理耗时用单调时钟扣除，避免再次读取墙上时钟
+                delta = (target_dt - now).total_seconds() - (time.monotonic() - now_ts)
+                sleep_seconds = max(0.1, delta)
+                self.logger.info("等待 %.0f 秒后进行下一次检查...", sleep_seconds)
+                await asyncio.sleep(sleep_seconds)
 
 def main():
     """
@@ -356,10 +482,10 @@ def main():
         try:
             monitor = WeatherMonitor()
             if len(sys.argv) > 1 and sys.argv[1] == '--test':
-                monitor.run_test_push()
+                asyncio.run(monitor.run_test_push())
                 break # 测试模式下运行一次后退出
             else:
-                monitor.run()
+                asyncio.run(monitor.run())
         except configparser.Error as e:
             logging.critical(f"致命错误：无法读取或解析 config.ini: {e}")
             break # 如果配置文件损坏，则退出